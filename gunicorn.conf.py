@@ -0,0 +1,9 @@
+import os
+
+# Every endpoint is a short DB round-trip: gevent lets one worker keep many
+# requests in flight instead of blocking on the socket (psycopg 3 and the
+# stdlib are cooperative once the gevent worker monkey-patches them).
+worker_class = "gevent"
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_connections = int(os.getenv("WORKER_CONNECTIONS", "100"))
+bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"